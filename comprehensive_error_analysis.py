@@ -8,247 +8,331 @@ Features:
 - Calculates (error + crc) / total_packets ratio for each port
 - Lists top 10 ports with highest error ratios
 - Combines functionality from multiple analysis scripts
+- Optional --json output of all qualifying interfaces for downstream tooling
 """
 
+import bisect
+import heapq
+import json
+import mmap
+import operator
+import os
 import re
+import stat
 import sys
-from typing import Dict, List, NamedTuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
-class InterfaceData(NamedTuple):
+_T = TypeVar('_T')
+
+# All line patterns for Cisco 'show interface' output fused into a single
+# multiline alternation, compiled once at import. Each alternative is wrapped
+# in an outer named group so that match.lastgroup identifies which line
+# matched. Every alternative is anchored to the start of a line (after any
+# leading whitespace other than a newline, as str.strip() would remove) and
+# kept within that line, so finditer() over the whole file visits the
+# recognised lines in order without a Python-level line loop.
+# Alternatives sharing a prefix are factored so each line start tries as few
+# branches as possible; for the counter lines the leading number is captured
+# once in 'count'. The pattern is bytes so it can scan the memory-mapped file
+# directly without decoding it.
+_RE_LINE = re.compile(
+    rb'^[^\S\n]*(?:'
+    rb'(?P<iface>(?P<name>[A-Za-z][A-Za-z0-9\-\.\/]+)[ \t]+is[ \t]+(?:up|down))'
+    rb'|5 minute (?:'
+    rb'(?P<in_rate>input rate.*?(?P<in_pps>\d+) packets/sec)'
+    rb'|(?P<out_rate>output rate.*?(?P<out_pps>\d+) packets/sec))'
+    rb'|(?P<count>\d+) (?:'
+    rb'(?P<in_pkts>packets input.*?(?P<idrops>\d+) total input drops)'
+    rb'|(?P<out_pkts>packets output.*?(?P<odrops>\d+) total output drops)'
+    rb'|(?P<err>input errors, (?P<crc>\d+) CRC, (?P<frame>\d+) frame, '
+    rb'(?P<overrun>\d+) overrun, (?P<ignored>\d+) ignored, (?P<abort>\d+) abort)'
+    rb'|(?P<oerr>output errors, (?P<underruns>\d+) underruns))'
+    rb')',
+    re.MULTILINE,
+)
+
+# A CR that does not start a CRLF pair, and any CR or CRLF line ending, for
+# normalising dumps whose lines are not split by LF alone
+_RE_LONE_CR = re.compile(rb'\r(?!\n)')
+_RE_NEWLINE = re.compile(rb'\r\n?')
+
+@dataclass(slots=True)
+class InterfaceData:
+    """Counters parsed for one interface, plus the ratios derived from them"""
     name: str
-    input_packets: int
-    output_packets: int
-    total_packets: int
-    input_rate: int  # packets/sec
-    output_rate: int  # packets/sec
-    input_errors: int
-    crc_errors: int
-    frame_errors: int
-    overrun_errors: int
-    ignored_errors: int
-    abort_errors: int
-    output_errors: int
-    underruns: int
-    input_drops: int
-    output_drops: int
-    error_crc_ratio: float  # (errors + crc) / input_packets
-    error_ratio: float
-    crc_ratio: float
-    output_error_ratio: float  # output_errors / output_packets
+    input_packets: int = 0
+    output_packets: int = 0
+    total_packets: int = 0
+    input_rate: int = 0  # packets/sec
+    output_rate: int = 0  # packets/sec
+    input_errors: int = 0
+    crc_errors: int = 0
+    frame_errors: int = 0
+    overrun_errors: int = 0
+    ignored_errors: int = 0
+    abort_errors: int = 0
+    output_errors: int = 0
+    underruns: int = 0
+    input_drops: int = 0
+    output_drops: int = 0
+    error_crc_ratio: float = 0.0  # (errors + crc) / input_packets
+    error_ratio: float = 0.0
+    crc_ratio: float = 0.0
+    output_error_ratio: float = 0.0  # output_errors / output_packets
 
-def parse_interface_data(filename: str) -> List[InterfaceData]:
-    """Parse Cisco interface data and extract all relevant statistics"""
+# Severity labels for a ratio (in %), chosen by how many thresholds it exceeds.
+# The top-N tables and the complete listing use different scales.
+_STATUS_THRESHOLDS = (0.01, 0.1, 1.0)
+_CLASSIFICATION_THRESHOLDS = (0.001, 0.01, 0.1)
+_SEVERITY_LABELS = ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+
+# Sort keys for ranking interfaces, extracted in C rather than by a lambda
+_KEY_ERROR_CRC_RATIO = operator.attrgetter('error_crc_ratio')
+_KEY_OUTPUT_ERROR_RATIO = operator.attrgetter('output_error_ratio')
+
+# Row layouts for the report tables, parsed once at import instead of
+# per row. Fields are positional to avoid building a mapping for each row.
+_TOP_10_ROW = '{:<4} {:<25} {:<12.6f} {:<12,} {:<15,} {:<10}'
+_TOP_5_OUTPUT_ROW = '{:<4} {:<25} {:<12.6f} {:<15,} {:<15,} {:<10}'
+_COMPLETE_ROW = '{:<25} {:<15,} {:<10,} {:<12.6f} {:<15}'
+
+def _scan_buffer(data) -> Iterator[re.Match]:
+    """Yield _RE_LINE matches from a bytes-like buffer of the whole file"""
+    
+    # The pattern splits lines on LF only. A CR before an LF is harmless (it
+    # just trails the line), so LF and CRLF dumps are scanned in place. Only
+    # a lone CR, as in CR-only and LF-CR dumps, ends a line the pattern would
+    # miss; those buffers get text mode's universal-newline treatment (CRLF
+    # and lone CR become LF) in one copying pass.
+    if _RE_LONE_CR.search(data):
+        data = _RE_NEWLINE.sub(b'\n', data)
+    
+    yield from _RE_LINE.finditer(data)
+
+def _scan_lines(filename: str) -> Iterator[re.Match]:
+    """Yield _RE_LINE matches from a file, memory-mapped when it is a regular file"""
+    
+    with open(filename, 'rb') as file:
+        st = os.fstat(file.fileno())
+        
+        # Pipes, FIFOs and character devices (e.g. /dev/stdin, <(...)) report
+        # no meaningful size and cannot be mapped, so read them instead
+        if not stat.S_ISREG(st.st_mode):
+            yield from _scan_buffer(file.read())
+            return
+        
+        # mmap cannot map an empty file, and there is nothing to scan anyway
+        if st.st_size == 0:
+            return
+        
+        # The regex engine scans the page cache directly: no read() copies and
+        # no decoding, and resident memory is reclaimable by the OS
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _scan_buffer(mapped)
+
+def _finalize_interface(data: InterfaceData) -> bool:
+    """Apply the traffic filters to a parsed interface and fill in its ratios
+    
+    Returns False for interfaces that are filtered out.
+    """
+    
+    # Skip interfaces with no packet traffic
+    data.total_packets = data.input_packets + data.output_packets
+    if data.total_packets == 0:
+        return False
+    
+    # Apply rate filter: exclude test ports (rate < 100k/sec)
+    max_rate = max(data.input_rate, data.output_rate)
+    if max_rate < 100000:  # 100k packets/sec threshold
+        return False
     
-    interfaces = []
-    current_interface = None
-    interface_stats = {}
+    # Calculate ratios based on input packets only (not combined)
+    if data.input_packets > 0:
+        data.error_crc_ratio = ((data.input_errors + data.crc_errors) / data.input_packets) * 100
+        data.error_ratio = (data.input_errors / data.input_packets) * 100
+        data.crc_ratio = (data.crc_errors / data.input_packets) * 100
+    
+    # Calculate output error ratio
+    if data.output_packets > 0:
+        data.output_error_ratio = (data.output_errors / data.output_packets) * 100
+    
+    return True
+
+def _parse_or_error(filename: str) -> Union[List[InterfaceData], str]:
+    """Parse Cisco interface data, returning an error message if the file cannot be parsed"""
+    
+    # Each interface is finalized as soon as its block ends, so filtered-out
+    # ports are never kept. Names map to None until then (or if filtered out),
+    # which keeps the order of first appearance and lets a repeated interface
+    # replace its earlier block.
+    interfaces: Dict[str, Optional[InterfaceData]] = {}
+    stats = None
     
     try:
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-        
-        for line in lines:
-            line = line.strip()
+        # Let the regex engine walk the file; only recognised lines reach Python
+        for match in _scan_lines(filename):
+            kind = match.lastgroup
             
             # Check for interface name (main interfaces and sub-interfaces)
-            interface_match = re.match(r'^([A-Za-z][A-Za-z0-9\-\.\/]+)\s+is\s+(up|down)', line)
-            if interface_match:
-                current_interface = interface_match.group(1)
-                interface_stats[current_interface] = {
-                    'name': current_interface,
-                    'input_packets': 0,
-                    'output_packets': 0,
-                    'input_rate': 0,
-                    'output_rate': 0,
-                    'input_errors': 0,
-                    'crc_errors': 0,
-                    'frame_errors': 0,
-                    'overrun_errors': 0,
-                    'ignored_errors': 0,
-                    'abort_errors': 0,
-                    'output_errors': 0,
-                    'underruns': 0,
-                    'input_drops': 0,
-                    'output_drops': 0
-                }
+            if kind == 'iface':
+                if stats is not None:
+                    interfaces[stats.name] = stats if _finalize_interface(stats) else None
+                stats = InterfaceData(match.group('name').decode('ascii'))
+                interfaces[stats.name] = None
                 continue
             
-            if current_interface and current_interface in interface_stats:
+            # Counters are bytes; int() parses them without decoding to str,
+            # and multi-field lines fetch all their groups in one call
+            if stats is not None:
                 # Parse 5-minute input rate
-                input_rate_match = re.search(r'5 minute input rate.*?(\d+) packets/sec', line)
-                if input_rate_match:
-                    interface_stats[current_interface]['input_rate'] = int(input_rate_match.group(1))
-                    continue
+                if kind == 'in_rate':
+                    stats.input_rate = int(match.group('in_pps'))
                 
                 # Parse 5-minute output rate
-                output_rate_match = re.search(r'5 minute output rate.*?(\d+) packets/sec', line)
-                if output_rate_match:
-                    interface_stats[current_interface]['output_rate'] = int(output_rate_match.group(1))
-                    continue
+                elif kind == 'out_rate':
+                    stats.output_rate = int(match.group('out_pps'))
                 
                 # Parse input packets
-                input_packets_match = re.search(r'(\d+) packets input.*?(\d+) total input drops', line)
-                if input_packets_match:
-                    interface_stats[current_interface]['input_packets'] = int(input_packets_match.group(1))
-                    interface_stats[current_interface]['input_drops'] = int(input_packets_match.group(2))
-                    continue
+                elif kind == 'in_pkts':
+                    stats.input_packets, stats.input_drops = map(int, match.group('count', 'idrops'))
                 
                 # Parse output packets
-                output_packets_match = re.search(r'(\d+) packets output.*?(\d+) total output drops', line)
-                if output_packets_match:
-                    interface_stats[current_interface]['output_packets'] = int(output_packets_match.group(1))
-                    interface_stats[current_interface]['output_drops'] = int(output_packets_match.group(2))
-                    continue
+                elif kind == 'out_pkts':
+                    stats.output_packets, stats.output_drops = map(int, match.group('count', 'odrops'))
                 
                 # Parse error statistics line
-                error_match = re.search(r'(\d+) input errors, (\d+) CRC, (\d+) frame, (\d+) overrun, (\d+) ignored, (\d+) abort', line)
-                if error_match:
-                    interface_stats[current_interface]['input_errors'] = int(error_match.group(1))
-                    interface_stats[current_interface]['crc_errors'] = int(error_match.group(2))
-                    interface_stats[current_interface]['frame_errors'] = int(error_match.group(3))
-                    interface_stats[current_interface]['overrun_errors'] = int(error_match.group(4))
-                    interface_stats[current_interface]['ignored_errors'] = int(error_match.group(5))
-                    interface_stats[current_interface]['abort_errors'] = int(error_match.group(6))
-                    continue
+                elif kind == 'err':
+                    (stats.input_errors, stats.crc_errors, stats.frame_errors,
+                     stats.overrun_errors, stats.ignored_errors, stats.abort_errors) = map(
+                        int, match.group('count', 'crc', 'frame', 'overrun', 'ignored', 'abort'))
                 
                 # Parse output errors
-                output_error_match = re.search(r'(\d+) output errors, (\d+) underruns', line)
-                if output_error_match:
-                    interface_stats[current_interface]['output_errors'] = int(output_error_match.group(1))
-                    interface_stats[current_interface]['underruns'] = int(output_error_match.group(2))
-                    continue
+                elif kind == 'oerr':
+                    stats.output_errors, stats.underruns = map(int, match.group('count', 'underruns'))
         
-        # Process parsed data and apply filters
-        for name, data in interface_stats.items():
-            # Skip interfaces with no packet traffic
-            total_packets = data['input_packets'] + data['output_packets']
-            if total_packets == 0:
-                continue
-            
-            # Apply rate filter: exclude test ports (rate < 100k/sec)
-            max_rate = max(data['input_rate'], data['output_rate'])
-            if max_rate < 100000:  # 100k packets/sec threshold
-                continue
-            
-            # Calculate ratios based on input packets only (not combined)
-            error_crc_sum = data['input_errors'] + data['crc_errors']
-            error_crc_ratio = (error_crc_sum / data['input_packets']) * 100 if data['input_packets'] > 0 else 0
-            error_ratio = (data['input_errors'] / data['input_packets']) * 100 if data['input_packets'] > 0 else 0
-            crc_ratio = (data['crc_errors'] / data['input_packets']) * 100 if data['input_packets'] > 0 else 0
-            
-            # Calculate output error ratio
-            output_error_ratio = (data['output_errors'] / data['output_packets']) * 100 if data['output_packets'] > 0 else 0
-            
-            interface_data = InterfaceData(
-                name=data['name'],
-                input_packets=data['input_packets'],
-                output_packets=data['output_packets'],
-                total_packets=total_packets,
-                input_rate=data['input_rate'],
-                output_rate=data['output_rate'],
-                input_errors=data['input_errors'],
-                crc_errors=data['crc_errors'],
-                frame_errors=data['frame_errors'],
-                overrun_errors=data['overrun_errors'],
-                ignored_errors=data['ignored_errors'],
-                abort_errors=data['abort_errors'],
-                output_errors=data['output_errors'],
-                underruns=data['underruns'],
-                input_drops=data['input_drops'],
-                output_drops=data['output_drops'],
-                error_crc_ratio=error_crc_ratio,
-                error_ratio=error_ratio,
-                crc_ratio=crc_ratio,
-                output_error_ratio=output_error_ratio
-            )
-            
-            interfaces.append(interface_data)
+        # The last interface's block ends at end of file
+        if stats is not None:
+            interfaces[stats.name] = stats if _finalize_interface(stats) else None
     
     except FileNotFoundError:
-        print(f"Error: File {filename} not found")
-        return []
+        return f"Error: File {filename} not found"
     except Exception as e:
-        print(f"Error parsing file: {e}")
+        return f"Error parsing file: {e}"
+    
+    return [interface for interface in interfaces.values() if interface is not None]
+
+def parse_interface_data(filename: str) -> List[InterfaceData]:
+    """Parse Cisco interface data and extract all relevant statistics
+    
+    Errors are reported on stderr and yield an empty list.
+    """
+    
+    result = _parse_or_error(filename)
+    if isinstance(result, str):
+        print(result, file=sys.stderr)
         return []
+    return result
+
+def _map_files(parse: Callable[[str], _T], filenames: List[str]) -> List[_T]:
+    """Apply parse to each file, in parallel worker processes when there are several"""
+    
+    if len(filenames) <= 1:
+        return [parse(filename) for filename in filenames]
     
-    return interfaces
+    # Flush first so forked workers do not inherit and re-emit buffered output
+    sys.stdout.flush()
+    
+    max_workers = min(len(filenames), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse, filenames))
+
+def parse_many(filenames: List[str]) -> List[List[InterfaceData]]:
+    """Parse several files in parallel worker processes, one result list per file"""
+    return _map_files(parse_interface_data, filenames)
+
+def _severity(ratio: float, thresholds: Tuple[float, ...] = _STATUS_THRESHOLDS) -> str:
+    """Label a ratio (in %) by how many of the thresholds it strictly exceeds"""
+    return _SEVERITY_LABELS[bisect.bisect_left(thresholds, ratio)]
+
+def _write_lines(lines: List[str]):
+    """Write a report section to stdout in a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def print_top_10_analysis(interfaces: List[InterfaceData]):
-    """Print top 10 interfaces with highest (error + crc) / total_packets ratio"""
+def print_top_10_analysis(sorted_interfaces: List[InterfaceData]):
+    """Print top 10 interfaces with highest (error + crc) / total_packets ratio
     
-    if not interfaces:
+    sorted_interfaces must already be sorted by error_crc_ratio, highest
+    first (main() sorts once for both reports); it is not re-sorted here.
+    """
+    
+    if not sorted_interfaces:
         print("No qualifying interface data found (after filtering test ports).")
         return
     
-    # Filter interfaces that have errors or CRC issues
-    problem_interfaces = [i for i in interfaces if i.error_crc_ratio > 0]
+    out = []
     
-    # Sort by (error + crc) / total_packets ratio descending
-    sorted_interfaces = sorted(problem_interfaces, key=lambda x: x.error_crc_ratio, reverse=True)
+    # Filter interfaces that have errors or CRC issues (order is preserved)
+    problem_interfaces = [i for i in sorted_interfaces if i.error_crc_ratio > 0]
+    top_10 = problem_interfaces[:10]
     
-    print("=" * 120)
-    print("COMPREHENSIVE CISCO INTERFACE ERROR AND CRC ANALYSIS")
-    print("=" * 120)
-    print("Analysis of high-traffic interfaces (5-min rate ≥ 100k packets/sec)")
-    print("Showing (Error + CRC) / Input_Packets ratio")
-    print("=" * 120)
+    out.append("=" * 120)
+    out.append("COMPREHENSIVE CISCO INTERFACE ERROR AND CRC ANALYSIS")
+    out.append("=" * 120)
+    out.append("Analysis of high-traffic interfaces (5-min rate ≥ 100k packets/sec)")
+    out.append("Showing (Error + CRC) / Input_Packets ratio")
+    out.append("=" * 120)
     
     # Summary statistics
-    total_analyzed = len(interfaces)
+    total_analyzed = len(sorted_interfaces)
     total_with_issues = len(problem_interfaces)
     
-    print(f"\nSUMMARY:")
-    print(f"Total high-traffic interfaces analyzed: {total_analyzed}")
-    print(f"Interfaces with error/CRC issues: {total_with_issues}")
-    print(f"Percentage with issues: {(total_with_issues/total_analyzed*100):.1f}%")
+    out.append(f"\nSUMMARY:")
+    out.append(f"Total high-traffic interfaces analyzed: {total_analyzed}")
+    out.append(f"Interfaces with error/CRC issues: {total_with_issues}")
+    out.append(f"Percentage with issues: {(total_with_issues/total_analyzed*100):.1f}%")
     
-    print(f"\nTOP 10 INTERFACES BY (ERROR + CRC) / INPUT_PACKETS RATIO:")
-    print("-" * 80)
+    out.append(f"\nTOP 10 INTERFACES BY (ERROR + CRC) / INPUT_PACKETS RATIO:")
+    out.append("-" * 80)
     
     header = f"{'Rank':<4} {'Interface':<25} {'(E+CRC)%':<12} {'Error+CRC':<12} {'Input Pkts':<15} {'Status':<10}"
-    print(header)
-    print("-" * 80)
-    
-    top_10 = sorted_interfaces[:10]
+    out.append(header)
+    out.append("-" * 80)
     
+    format_row = _TOP_10_ROW.format
     for i, interface in enumerate(top_10, 1):
         # Determine severity status
-        if interface.error_crc_ratio > 1.0:
-            status = "CRITICAL"
-        elif interface.error_crc_ratio > 0.1:
-            status = "HIGH"
-        elif interface.error_crc_ratio > 0.01:
-            status = "MEDIUM"
-        else:
-            status = "LOW"
+        status = _severity(interface.error_crc_ratio)
         
         error_crc_sum = interface.input_errors + interface.crc_errors
         
-        row = f"{i:<4} {interface.name:<25} {interface.error_crc_ratio:<12.6f} {error_crc_sum:<12,} {interface.input_packets:<15,} {status:<10}"
-        print(row)
+        out.append(format_row(i, interface.name, interface.error_crc_ratio, error_crc_sum, interface.input_packets, status))
     
-    print(f"\nDETAILED BREAKDOWN OF TOP 10:")
-    print("-" * 80)
+    out.append(f"\nDETAILED BREAKDOWN OF TOP 10:")
+    out.append("-" * 80)
     
     for i, interface in enumerate(top_10, 1):
         error_crc_sum = interface.input_errors + interface.crc_errors
         
-        print(f"\n{i}. Interface: {interface.name}")
-        print(f"   Input Packets:        {interface.input_packets:,}")
-        print(f"   Input Errors:         {interface.input_errors:,}")
-        print(f"   CRC Errors:           {interface.crc_errors:,}")
-        print(f"   Error + CRC Sum:      {error_crc_sum:,}")
-        print(f"   (Error+CRC)/Input:    {interface.error_crc_ratio:.6f}%")
-        print(f"   Error/Input Ratio:    {interface.error_ratio:.6f}%")
-        print(f"   CRC/Input Ratio:      {interface.crc_ratio:.6f}%")
+        out.append(f"\n{i}. Interface: {interface.name}")
+        out.append(f"   Input Packets:        {interface.input_packets:,}")
+        out.append(f"   Input Errors:         {interface.input_errors:,}")
+        out.append(f"   CRC Errors:           {interface.crc_errors:,}")
+        out.append(f"   Error + CRC Sum:      {error_crc_sum:,}")
+        out.append(f"   (Error+CRC)/Input:    {interface.error_crc_ratio:.6f}%")
+        out.append(f"   Error/Input Ratio:    {interface.error_ratio:.6f}%")
+        out.append(f"   CRC/Input Ratio:      {interface.crc_ratio:.6f}%")
         
         if interface.frame_errors > 0:
-            print(f"   Frame Errors:         {interface.frame_errors:,}")
+            out.append(f"   Frame Errors:         {interface.frame_errors:,}")
         if interface.output_errors > 0:
-            print(f"   Output Errors:        {interface.output_errors:,}")
+            out.append(f"   Output Errors:        {interface.output_errors:,}")
         if interface.input_drops > 0 or interface.output_drops > 0:
-            print(f"   Input Drops:          {interface.input_drops:,}")
-            print(f"   Output Drops:         {interface.output_drops:,}")
+            out.append(f"   Input Drops:          {interface.input_drops:,}")
+            out.append(f"   Output Drops:         {interface.output_drops:,}")
+    
+    _write_lines(out)
 
 def print_top_5_output_errors(interfaces: List[InterfaceData]):
     """Print top 5 interfaces with highest output error ratios"""
@@ -262,128 +346,175 @@ def print_top_5_output_errors(interfaces: List[InterfaceData]):
         print("All high-traffic interfaces have 0 output errors.")
         return
     
-    # Sort by output error ratio descending
-    sorted_output_errors = sorted(output_error_interfaces, key=lambda x: x.output_error_ratio, reverse=True)
+    out = []
     
-    print(f"\nTOP 5 INTERFACES BY OUTPUT ERROR RATIO:")
-    print("=" * 80)
-    print("Analysis of interfaces with output errors / output_packets")
-    print("=" * 80)
+    # Select the 5 highest output error ratios without a full sort
+    top_5_output = heapq.nlargest(5, output_error_interfaces, key=_KEY_OUTPUT_ERROR_RATIO)
     
-    header = f"{'Rank':<4} {'Interface':<25} {'Output Err%':<12} {'Output Errors':<15} {'Output Pkts':<15} {'Status':<10}"
-    print(header)
-    print("-" * 80)
+    out.append(f"\nTOP 5 INTERFACES BY OUTPUT ERROR RATIO:")
+    out.append("=" * 80)
+    out.append("Analysis of interfaces with output errors / output_packets")
+    out.append("=" * 80)
     
-    top_5_output = sorted_output_errors[:5]
+    header = f"{'Rank':<4} {'Interface':<25} {'Output Err%':<12} {'Output Errors':<15} {'Output Pkts':<15} {'Status':<10}"
+    out.append(header)
+    out.append("-" * 80)
     
+    format_row = _TOP_5_OUTPUT_ROW.format
     for i, interface in enumerate(top_5_output, 1):
         # Determine severity status for output errors
-        if interface.output_error_ratio > 1.0:
-            status = "CRITICAL"
-        elif interface.output_error_ratio > 0.1:
-            status = "HIGH"
-        elif interface.output_error_ratio > 0.01:
-            status = "MEDIUM"
-        else:
-            status = "LOW"
+        status = _severity(interface.output_error_ratio)
         
-        row = f"{i:<4} {interface.name:<25} {interface.output_error_ratio:<12.6f} {interface.output_errors:<15,} {interface.output_packets:<15,} {status:<10}"
-        print(row)
+        out.append(format_row(i, interface.name, interface.output_error_ratio, interface.output_errors, interface.output_packets, status))
     
-    print(f"\nDETAILED BREAKDOWN OF TOP 5 OUTPUT ERROR INTERFACES:")
-    print("-" * 80)
+    out.append(f"\nDETAILED BREAKDOWN OF TOP 5 OUTPUT ERROR INTERFACES:")
+    out.append("-" * 80)
     
     for i, interface in enumerate(top_5_output, 1):
-        print(f"\n{i}. Interface: {interface.name}")
-        print(f"   Output Packets:       {interface.output_packets:,}")
-        print(f"   Output Errors:        {interface.output_errors:,}")
-        print(f"   Output Error Ratio:   {interface.output_error_ratio:.6f}%")
-        print(f"   Underruns:            {interface.underruns:,}")
+        out.append(f"\n{i}. Interface: {interface.name}")
+        out.append(f"   Output Packets:       {interface.output_packets:,}")
+        out.append(f"   Output Errors:        {interface.output_errors:,}")
+        out.append(f"   Output Error Ratio:   {interface.output_error_ratio:.6f}%")
+        out.append(f"   Underruns:            {interface.underruns:,}")
         if interface.output_drops > 0:
-            print(f"   Output Drops:         {interface.output_drops:,}")
+            out.append(f"   Output Drops:         {interface.output_drops:,}")
+    
+    _write_lines(out)
 
-def print_complete_analysis(interfaces: List[InterfaceData]):
-    """Print complete analysis similar to existing scripts"""
+def print_complete_analysis(sorted_interfaces: List[InterfaceData]):
+    """Print complete analysis similar to existing scripts
     
-    if not interfaces:
+    sorted_interfaces must already be sorted by error_crc_ratio, highest
+    first (main() sorts once for both reports); it is not re-sorted here.
+    """
+    
+    if not sorted_interfaces:
         return
     
-    print(f"\n\n" + "=" * 100)
-    print("COMPLETE HIGH-TRAFFIC INTERFACE ANALYSIS")
-    print("=" * 100)
-    print("All interfaces with 5-minute rate ≥ 100k packets/sec, sorted by error+CRC ratio")
-    print("=" * 100)
+    out = []
     
-    # Sort all interfaces by error_crc_ratio
-    all_sorted = sorted(interfaces, key=lambda x: x.error_crc_ratio, reverse=True)
+    out.append(f"\n\n" + "=" * 100)
+    out.append("COMPLETE HIGH-TRAFFIC INTERFACE ANALYSIS")
+    out.append("=" * 100)
+    out.append("All interfaces with 5-minute rate ≥ 100k packets/sec, sorted by error+CRC ratio")
+    out.append("=" * 100)
     
     header = f"{'Interface':<25} {'Input Pkts':<15} {'E+CRC':<10} {'(E+CRC)%':<12} {'Classification':<15}"
-    print(header)
-    print("-" * 80)
+    out.append(header)
+    out.append("-" * 80)
     
-    for interface in all_sorted:
+    format_row = _COMPLETE_ROW.format
+    for interface in sorted_interfaces:
         error_crc_sum = interface.input_errors + interface.crc_errors
         
-        if interface.error_crc_ratio > 0.1:
-            classification = "CRITICAL"
-        elif interface.error_crc_ratio > 0.01:
-            classification = "HIGH"
-        elif interface.error_crc_ratio > 0.001:
-            classification = "MEDIUM"
-        elif error_crc_sum > 0:
-            classification = "LOW"
+        if error_crc_sum > 0:
+            classification = _severity(interface.error_crc_ratio, _CLASSIFICATION_THRESHOLDS)
         else:
             classification = "GOOD"
         
-        row = f"{interface.name:<25} {interface.input_packets:<15,} {error_crc_sum:<10,} {interface.error_crc_ratio:<12.6f} {classification:<15}"
-        print(row)
+        out.append(format_row(interface.name, interface.input_packets, error_crc_sum, interface.error_crc_ratio, classification))
     
     # Network-wide statistics
-    print(f"\n" + "=" * 80)
-    print("NETWORK-WIDE STATISTICS (High-Traffic Interfaces Only)")
-    print("=" * 80)
-    
-    total_input_packets = sum(i.input_packets for i in interfaces)
-    total_output_packets = sum(i.output_packets for i in interfaces)
-    total_input_errors = sum(i.input_errors for i in interfaces)
-    total_crc_errors = sum(i.crc_errors for i in interfaces)
-    total_output_errors = sum(i.output_errors for i in interfaces)
-    total_input_drops = sum(i.input_drops for i in interfaces)
-    total_output_drops = sum(i.output_drops for i in interfaces)
+    out.append(f"\n" + "=" * 80)
+    out.append("NETWORK-WIDE STATISTICS (High-Traffic Interfaces Only)")
+    out.append("=" * 80)
+    
+    # Accumulate all network totals in a single pass over the interfaces
+    total_input_packets = total_output_packets = 0
+    total_input_errors = total_crc_errors = total_output_errors = 0
+    total_input_drops = total_output_drops = 0
+    for i in sorted_interfaces:
+        total_input_packets += i.input_packets
+        total_output_packets += i.output_packets
+        total_input_errors += i.input_errors
+        total_crc_errors += i.crc_errors
+        total_output_errors += i.output_errors
+        total_input_drops += i.input_drops
+        total_output_drops += i.output_drops
     
     overall_error_crc_ratio = ((total_input_errors + total_crc_errors) / total_input_packets) * 100 if total_input_packets > 0 else 0
     
-    print(f"Total Input Packets:      {total_input_packets:,}")
-    print(f"Total Output Packets:     {total_output_packets:,}")
-    print(f"Total Input Errors:       {total_input_errors:,}")
-    print(f"Total CRC Errors:         {total_crc_errors:,}")
-    print(f"Total Output Errors:      {total_output_errors:,}")
-    print(f"Total Input Drops:        {total_input_drops:,}")
-    print(f"Total Output Drops:       {total_output_drops:,}")
-    print(f"Overall (Error+CRC)/Input Rate: {overall_error_crc_ratio:.6f}%")
+    out.append(f"Total Input Packets:      {total_input_packets:,}")
+    out.append(f"Total Output Packets:     {total_output_packets:,}")
+    out.append(f"Total Input Errors:       {total_input_errors:,}")
+    out.append(f"Total CRC Errors:         {total_crc_errors:,}")
+    out.append(f"Total Output Errors:      {total_output_errors:,}")
+    out.append(f"Total Input Drops:        {total_input_drops:,}")
+    out.append(f"Total Output Drops:       {total_output_drops:,}")
+    out.append(f"Overall (Error+CRC)/Input Rate: {overall_error_crc_ratio:.6f}%")
+    
+    _write_lines(out)
+
+def print_json(filenames: List[str], results: List[Union[List[InterfaceData], str]]) -> bool:
+    """Print parsed interfaces as JSON: a list for one file, one entry per file for several
+    
+    With several files the output is a list, in argument order, of
+    {"file": filename, "interfaces": [...]} objects, so a file given twice is
+    reported twice rather than overwriting itself. A file that failed to parse
+    is reported on stderr; with several files its entry is
+    {"file": filename, "error": message}, and a single failed file prints no
+    JSON at all.
+    Returns False if any file failed, so a clean switch ([]) can be told
+    apart from a missing or unreadable dump.
+    """
+    
+    ok = True
+    for result in results:
+        if isinstance(result, str):
+            print(result, file=sys.stderr)
+            ok = False
+    
+    if len(filenames) == 1:
+        if not ok:
+            return False
+        payload = [asdict(interface) for interface in results[0]]
+    else:
+        payload = [
+            {'file': filename, 'error': result} if isinstance(result, str)
+            else {'file': filename, 'interfaces': [asdict(interface) for interface in result]}
+            for filename, result in zip(filenames, results)
+        ]
+    
+    sys.stdout.write(json.dumps(payload) + '\n')
+    return ok
 
 def main():
     """Main function to run the comprehensive analysis"""
     
-    # Allow filename to be passed as command line argument
+    # Allow one or more filenames to be passed as command line arguments,
+    # plus --json to emit machine-readable output instead of the reports
     import sys
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    else:
-        filename = "/home/ec2-user/int_error/int_error.txt"
+    args = sys.argv[1:]
+    as_json = '--json' in args
+    filenames = [arg for arg in args if arg != '--json']
+    if not filenames:
+        filenames = ["/home/ec2-user/int_error/int_error.txt"]
+    
+    if as_json:
+        if not print_json(filenames, _map_files(_parse_or_error, filenames)):
+            sys.exit(1)
+        return
     
-    print(f"Parsing Cisco interface data from {filename}...")
+    for filename in filenames:
+        print(f"Parsing Cisco interface data from {filename}...")
     print("Filtering out test ports (5-minute rate < 100k packets/sec)...")
     
-    interfaces = parse_interface_data(filename)
-    
-    if interfaces:
-        print(f"Successfully parsed {len(interfaces)} high-traffic interfaces.")
-        print_top_10_analysis(interfaces)
-        print_top_5_output_errors(interfaces)
-        print_complete_analysis(interfaces)
-    else:
-        print("No interface data could be parsed from the file.")
+    for filename, interfaces in zip(filenames, parse_many(filenames)):
+        if len(filenames) > 1:
+            print(f"\n" + "#" * 120)
+            print(f"RESULTS FOR {filename}")
+            print("#" * 120)
+        
+        if interfaces:
+            print(f"Successfully parsed {len(interfaces)} high-traffic interfaces.")
+            
+            # Sort once by error_crc_ratio; both error/CRC reports reuse this order
+            sorted_interfaces = sorted(interfaces, key=_KEY_ERROR_CRC_RATIO, reverse=True)
+            print_top_10_analysis(sorted_interfaces)
+            print_top_5_output_errors(interfaces)
+            print_complete_analysis(sorted_interfaces)
+        else:
+            print("No interface data could be parsed from the file.")
     
     print(f"\n" + "=" * 80)
     print("ANALYSIS COMPLETE")
@@ -0,0 +1,196 @@
+"""Regression tests for comprehensive_error_analysis (run: python3 -m unittest)"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import comprehensive_error_analysis as analysis
+
+SAMPLE_DUMP = """\
+RP/0/RSP0/CPU0:router#show interface
+HundredGigE0/0/0/1 is up, line protocol is up
+  Hardware is HundredGigE, address is 0011.2233.4455
+  5 minute input rate 1600000000 bits/sec, 200000 packets/sec
+  5 minute output rate 800000000 bits/sec, 100000 packets/sec
+     1000000 packets input, 900000000 bytes, 7 total input drops
+     100 input errors, 50 CRC, 3 frame, 0 overrun, 0 ignored, 0 abort
+     2000000 packets output, 1800000000 bytes, 9 total output drops
+     20 output errors, 2 underruns, 0 applique, 0 resets
+
+Bundle-Ether7.100 is up, line protocol is up
+  5 minute input rate 0 bits/sec, 0 packets/sec
+  5 minute output rate 2400000000 bits/sec, 300000 packets/sec
+     0 packets input, 0 bytes, 0 total input drops
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+     5000000 packets output, 4500000000 bytes, 0 total output drops
+     0 output errors, 0 underruns, 0 applique, 0 resets
+
+TenGigE0/1/0/3 is down, line protocol is down
+  5 minute input rate 8000 bits/sec, 10 packets/sec
+  5 minute output rate 8000 bits/sec, 10 packets/sec
+     5000 packets input, 4500000 bytes, 0 total input drops
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+     5000 packets output, 4500000 bytes, 0 total output drops
+     0 output errors, 0 underruns, 0 applique, 0 resets
+"""
+
+# Line endings that text mode's universal newlines accepts
+LINE_ENDINGS = {'LF': b'\n', 'CRLF': b'\r\n', 'CR': b'\r', 'LF-CR': b'\n\r'}
+
+
+class LineEndingTests(unittest.TestCase):
+    """Every line ending must parse exactly like the LF dump, for files and pipes"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def dump(self, ending: bytes) -> bytes:
+        return SAMPLE_DUMP.encode('ascii').replace(b'\n', ending)
+
+    def write_file(self, data: bytes) -> str:
+        path = os.path.join(self.tmpdir.name, 'dump.txt')
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def assert_parsed(self, interfaces):
+        # The low-rate TenGigE test port is filtered out
+        self.assertEqual([i.name for i in interfaces], ['HundredGigE0/0/0/1', 'Bundle-Ether7.100'])
+        first = interfaces[0]
+        self.assertEqual((first.input_packets, first.input_drops), (1000000, 7))
+        self.assertEqual((first.input_errors, first.crc_errors, first.frame_errors), (100, 50, 3))
+        self.assertEqual((first.output_packets, first.output_drops), (2000000, 9))
+        self.assertEqual((first.output_errors, first.underruns), (20, 2))
+        self.assertAlmostEqual(first.error_crc_ratio, 0.015)
+        self.assertEqual(interfaces[1].output_rate, 300000)
+
+    def test_regular_file(self):
+        for label, ending in LINE_ENDINGS.items():
+            with self.subTest(ending=label):
+                path = self.write_file(self.dump(ending))
+                self.assert_parsed(analysis.parse_interface_data(path))
+
+    def test_crlf_scanned_in_place(self):
+        # CRLF needs no normalising, so matches come from the caller's buffer
+        data = self.dump(b'\r\n')
+        matches = list(analysis._scan_buffer(data))
+        self.assertTrue(matches)
+        self.assertTrue(all(match.string is data for match in matches))
+
+        # A lone CR forces the normalised copy
+        data = self.dump(b'\r')
+        self.assertTrue(all(match.string is not data for match in analysis._scan_buffer(data)))
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'requires os.mkfifo')
+    def test_pipe(self):
+        for label, ending in LINE_ENDINGS.items():
+            with self.subTest(ending=label):
+                path = os.path.join(self.tmpdir.name, f'fifo-{len(ending)}-{ending[0]}')
+                os.mkfifo(path)
+                data = self.dump(ending)
+
+                def feed():
+                    with open(path, 'wb') as fifo:
+                        fifo.write(data)
+
+                writer = threading.Thread(target=feed)
+                writer.start()
+                try:
+                    self.assert_parsed(analysis.parse_interface_data(path))
+                finally:
+                    writer.join()
+
+
+class ParseManyTests(unittest.TestCase):
+    """Several files are parsed in worker processes, one result per file in argument order"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.dump = os.path.join(self.tmpdir.name, 'dump.txt')
+        with open(self.dump, 'w') as file:
+            file.write(SAMPLE_DUMP)
+        # Only the Bundle-Ether block, so the two results can be told apart
+        self.bundle = os.path.join(self.tmpdir.name, 'bundle.txt')
+        with open(self.bundle, 'w') as file:
+            file.write(SAMPLE_DUMP[SAMPLE_DUMP.index('Bundle-Ether7.100'):])
+        self.missing = os.path.join(self.tmpdir.name, 'missing.txt')
+
+    def test_result_order_and_missing_file(self):
+        # The missing file's error is printed by a worker process, not captured here
+        results = analysis.parse_many([self.bundle, self.missing, self.dump])
+        self.assertEqual([[i.name for i in result] for result in results], [
+            ['Bundle-Ether7.100'],
+            [],
+            ['HundredGigE0/0/0/1', 'Bundle-Ether7.100'],
+        ])
+
+    def test_text_report_sections(self):
+        stdout = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['comprehensive_error_analysis.py', self.bundle, self.dump]), \
+                contextlib.redirect_stdout(stdout):
+            analysis.main()
+        out = stdout.getvalue()
+        self.assertLess(out.index(f'RESULTS FOR {self.bundle}'), out.index(f'RESULTS FOR {self.dump}'))
+        self.assertEqual(out.count('Successfully parsed'), 2)
+
+
+class JsonOutputTests(unittest.TestCase):
+    """--json must let consumers tell a clean switch from a failed parse"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.dump = os.path.join(self.tmpdir.name, 'dump.txt')
+        with open(self.dump, 'w') as file:
+            file.write(SAMPLE_DUMP)
+        self.missing = os.path.join(self.tmpdir.name, 'missing.txt')
+
+    def run_main(self, *args):
+        """Run main() with the given arguments; return (exit code, stdout, stderr)"""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        with mock.patch.object(sys, 'argv', ['comprehensive_error_analysis.py', '--json', *args]), \
+                contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                analysis.main()
+            except SystemExit as exit:
+                code = exit.code
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_single_file(self):
+        code, out, _ = self.run_main(self.dump)
+        self.assertEqual(code, 0)
+        self.assertEqual([i['name'] for i in json.loads(out)], ['HundredGigE0/0/0/1', 'Bundle-Ether7.100'])
+
+    def test_single_missing_file_fails(self):
+        code, out, err = self.run_main(self.missing)
+        self.assertEqual(code, 1)
+        self.assertEqual(out, '')
+        self.assertIn('not found', err)
+
+    def test_multiple_files_mark_failures(self):
+        code, out, _ = self.run_main(self.dump, self.missing)
+        self.assertEqual(code, 1)
+        payload = json.loads(out)
+        self.assertEqual([entry['file'] for entry in payload], [self.dump, self.missing])
+        self.assertEqual(len(payload[0]['interfaces']), 2)
+        self.assertIn('not found', payload[1]['error'])
+
+    def test_repeated_file_reported_each_time(self):
+        code, out, _ = self.run_main(self.dump, self.dump)
+        self.assertEqual(code, 0)
+        payload = json.loads(out)
+        self.assertEqual([entry['file'] for entry in payload], [self.dump, self.dump])
+        self.assertEqual([len(entry['interfaces']) for entry in payload], [2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()